@@ -1,31 +1,175 @@
+import asyncio
 import inspect
 import threading
-from collections.abc import Callable, Generator
-from contextlib import contextmanager
+import weakref
+from collections.abc import Awaitable, Callable, Generator
+from contextlib import contextmanager, suppress
 from contextvars import ContextVar
-from functools import lru_cache
+from functools import partial
 from typing import Any
 
 from .enums import ServiceLifetime
-from .exceptions import CircularDependencyError, DependencyNotFoundError, DependencyRegistrationError
+from .exceptions import (
+    AsyncDependencyError,
+    CircularDependencyError,
+    DependencyNotFoundError,
+    DependencyRegistrationError,
+)
 
 
-class DependencyConfig[T]:
-    def __init__(self, provider: Callable[..., T], lifetime: ServiceLifetime) -> None:
-        self.provider = provider
-        self.lifetime = lifetime
+# Marks a provider parameter without a default value in the cached parameter plan
+_MISSING: Any = object()
+
+_VARIADIC_KINDS = frozenset({inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD})
+
+
+def _extract_params(provider: Callable[..., Any]) -> tuple[list[tuple[str, Any, Any]], bool]:
+    """
+    Introspects a provider once and returns its injectable parameters.
+
+    Each entry is a `(name, annotation, default)` tuple where a missing annotation is stored
+    as None and a missing default as `_MISSING`. `self` and variadic parameters are skipped.
+    The returned flag tells whether every entry can be passed positionally.
+    """
+    target = provider.__init__ if inspect.isclass(provider) else provider
+    try:
+        sig = inspect.signature(target)
+    except (TypeError, ValueError):
+        return [], True
+
+    empty = inspect.Parameter.empty
+    params = []
+    positional = True
+    for name, param in sig.parameters.items():
+        if name == "self" or param.kind in _VARIADIC_KINDS:
+            continue
+        if param.kind == inspect.Parameter.KEYWORD_ONLY:
+            positional = False
+        params.append(
+            (
+                name,
+                param.annotation if param.annotation is not empty else None,
+                param.default if param.default is not empty else _MISSING,
+            )
+        )
+    return params, positional
+
+
+def _make_builder[T](
+    provider: Callable[..., T],
+    arguments: list[tuple[str, Callable[[], Any] | None, Any]],
+    positional: bool,
+) -> Callable[[], T]:
+    """
+    Creates a closure that calls the provider with its resolved dependencies and defaults.
+
+    `arguments` holds `(name, resolver, default)` entries in parameter order, where the
+    resolver is None for plain default values. When every parameter is covered and none is
+    keyword-only, the provider is called positionally to skip building a kwargs dict.
+    Providers without arguments are returned as-is, so leaf services are a direct call.
+    """
+    if not arguments:
+        return provider
+
+    if positional:
+        values = [(resolve, default) for _, resolve, default in arguments]
+
+        def build() -> T:
+            return provider(*[default if resolve is None else resolve() for resolve, default in values])
+
+        return build
+
+    def build_kwargs() -> T:
+        return provider(**{name: default if resolve is None else resolve() for name, resolve, default in arguments})
+
+    return build_kwargs
+
+
+def _make_async_builder[T](
+    provider: Callable[..., Any],
+    arguments: list[tuple[str, Callable[[], Awaitable[Any]] | None, Any]],
+    is_async: bool,
+) -> Callable[[], Awaitable[T]]:
+    """Creates a coroutine function that awaits dependencies and, for async providers, the provider itself."""
+
+    async def build() -> T:
+        kwargs = {}
+        for name, resolve, default in arguments:
+            kwargs[name] = default if resolve is None else await resolve()
+        instance = provider(**kwargs)
+        return await instance if is_async else instance
+
+    return build
+
+
+def _guard_factory[T](build: Callable[[], T], interface: type, active: ContextVar[tuple[type, ...]]) -> Callable[[], T]:
+    """
+    Wraps a factory builder so a factory that resolves its own interface again raises.
+
+    Only factories need this: class providers are fully covered by the compile-time check.
+    The guard runs inside the builder, so cached singletons and class-only graphs skip it.
+    """
+
+    def guarded() -> T:
+        stack = active.get()
+        if interface in stack:
+            raise CircularDependencyError(f"Circular dependency detected for {interface}")
+        token = active.set((*stack, interface))
+        try:
+            return build()
+        finally:
+            active.reset(token)
+
+    return guarded
+
+
+def _guard_factory_async[T](
+    build: Callable[[], Awaitable[T]], interface: type, active: ContextVar[tuple[type, ...]]
+) -> Callable[[], Awaitable[T]]:
+    """Async counterpart of `_guard_factory`."""
+
+    async def guarded() -> T:
+        stack = active.get()
+        if interface in stack:
+            raise CircularDependencyError(f"Circular dependency detected for {interface}")
+        token = active.set((*stack, interface))
+        try:
+            return await build()
+        finally:
+            active.reset(token)
+
+    return guarded
+
+
+def _make_existing_singleton_resolver[T](config: "DependencyConfig[T]", message: str) -> Callable[[], T]:
+    """Creates a resolver that returns an already built singleton and raises AsyncDependencyError otherwise."""
 
+    def resolve_existing() -> T:
+        instance = config.instance
+        if instance is _MISSING:
+            raise AsyncDependencyError(message)
+        return instance
+
+    return resolve_existing
 
-def _create_singleton_wrapper[T](cls: type[T]) -> Callable[..., T]:
-    @lru_cache(maxsize=1)
-    def singleton_factory(*args, **kwargs) -> T:
-        return cls(*args, **kwargs)
 
-    old_sig = inspect.signature(cls.__init__)
-    new_params = [p for name, p in old_sig.parameters.items() if name != "self"]
-    singleton_factory.__signature__ = old_sig.replace(parameters=new_params)  # type: ignore
+class DependencyConfig[T]:
+    __slots__ = ("building", "instance", "is_async", "lifetime", "lock", "params", "pending", "positional", "provider")
 
-    return singleton_factory
+    def __init__(self, provider: Callable[..., T], lifetime: ServiceLifetime) -> None:
+        self.provider = provider
+        self.lifetime = lifetime
+        self.params, self.positional = _extract_params(provider)
+        self.is_async = inspect.iscoroutinefunction(provider)
+        # Singleton instance, stored on the config so a cache hit needs no extra dict lookup
+        self.instance: Any = _MISSING
+        # Per-registration lock guarding every read-check-write of `instance`, so building one
+        # singleton never blocks unrelated ones. Reentrant so that a provider re-entering its own
+        # resolution reaches the `building` check and raises instead of deadlocking
+        self.lock = threading.RLock()
+        self.building = False
+        # Future of the async build in flight, awaited by concurrent callers (see _build_singleton_once)
+        self.pending: asyncio.Future[Any] | None = None
 
 
 class Container:
@@ -37,12 +181,19 @@ class Container:
 
     def __init__(self):
         self._registry: dict[type, DependencyConfig] = {}
-        # Use frozenset as default to avoid shared mutable state issues
-        self._resolving_ctx: ContextVar[set[type]] = ContextVar("resolving", default=frozenset())
-        self._singletons: dict[type, Any] = {}
-        self._lock = threading.Lock()
+        # Resolver closures built on first resolution, invalidated whenever the registry changes
+        self._compiled: dict[type, Callable[[], Any]] = {}
+        self._compiled_async: dict[type, Callable[[], Awaitable[Any]]] = {}
         self._scope_ctx: ContextVar[dict[type, Any] | None] = ContextVar("scope_ctx", default=None)
+        # Interfaces whose factory provider is running in this context, see _guard_factory
+        self._factories_ctx: ContextVar[tuple[type, ...]] = ContextVar("factories_ctx", default=())
         self._initialized_services: set[int] = set()  # Track initialized instances by id
+        self._startup_plans: dict[type, tuple[bool, bool]] = {}  # (has on_startup, is coroutine) per class
+        # Reverse index of class providers to the interfaces they were registered under. Only
+        # ever appended to between resets, so readers must confirm entries against _registry
+        self._interfaces_by_provider: dict[type, list[type]] = {}
+        # FastAPI Depends markers built for registrations, see reflection._dependency_marker
+        self._dependency_markers: dict[tuple[Any, ServiceLifetime, Any], Any] = {}
 
     def register[T](
         self,
@@ -65,6 +216,14 @@ class Container:
             raise DependencyRegistrationError(f"Provider for {interface} must be callable.")
 
         self._registry[interface] = DependencyConfig(provider, lifetime)
+        if inspect.isclass(provider):
+            interfaces = self._interfaces_by_provider.setdefault(provider, [])
+            if interface not in interfaces:
+                interfaces.append(interface)
+        # Rebind instead of clear() so a compile already in flight cannot store a stale
+        # resolver into the fresh caches
+        self._compiled = {}
+        self._compiled_async = {}
 
     def get_config[T](self, interface: type[T]) -> DependencyConfig[T] | None:
         """
@@ -91,13 +250,14 @@ class Container:
         Raises:
             DependencyNotFoundError: If the dependency is not registered.
             CircularDependencyError: If a circular dependency is detected.
+            AsyncDependencyError: If the dependency (or one it needs) has an async provider.
         """
         return self._resolve_impl(interface)
 
     async def resolve_async[T](self, interface: type[T]) -> T:
         """
         Resolves a dependency recursively (Asynchronous).
-        Waits for on_startup hooks if present.
+        Awaits coroutine providers (e.g. async factories) and waits for on_startup hooks if present.
 
         Args:
             interface: The interface or type to resolve.
@@ -105,111 +265,275 @@ class Container:
         Returns:
             The resolved instance.
         """
-        instance = self._resolve_impl(interface)
+        resolver = self._compiled_async.get(interface)
+        if resolver is None:
+            resolver = self._compile(interface, asynchronous=True)
+        instance = await resolver()
         await self._run_startup_hooks(instance)
         return instance
 
     def _resolve_impl[T](self, interface: type[T]) -> T:
-        resolving = self._resolving_ctx.get()
+        resolver = self._compiled.get(interface)
+        if resolver is None:
+            resolver = self._compile(interface)
+        return resolver()
+
+    def _compile(self, interface: type, asynchronous: bool = False) -> Callable[[], Any]:
+        """
+        Builds and caches a resolver closure for the given interface.
+
+        The dependency graph is walked once here, so circular dependencies between constructors
+        are detected at compile time and subsequent resolutions only call the prebuilt closures.
+        Factory providers may call back into the container, which the graph walk cannot see, so
+        their builders are wrapped with a runtime guard (see `_guard_factory`). With
+        `asynchronous=True` the resolvers are coroutine functions that await async providers.
+
+        The registry and resolver cache are read once and passed down the walk, so a concurrent
+        `register()` or `reset()` cannot mix two registries into one graph; the resolvers then
+        land in the cache that was just replaced and are simply dropped.
+        """
+        compiled = self._compiled_async if asynchronous else self._compiled
+        return self._compile_node(interface, self._registry, compiled, [], asynchronous)
+
+    def _compile_node(
+        self,
+        interface: type,
+        registry: dict[type, DependencyConfig],
+        compiled: dict[type, Callable[[], Any]],
+        resolving: list[type],
+        asynchronous: bool,
+    ) -> Callable[[], Any]:
+        resolver = compiled.get(interface)
+        if resolver is not None:
+            return resolver
+
         if interface in resolving:
             raise CircularDependencyError(f"Circular dependency detected for {interface}")
 
-        config = self.get_config(interface)
+        config = registry.get(interface)
         if not config:
             raise DependencyNotFoundError(f"No provider registered for {interface}")
+        if config.is_async and not asynchronous:
+            # Calling the provider here would hand out (and, for singletons, cache) an un-awaited coroutine
+            message = f"The provider for {interface} is a coroutine function; use 'await container.resolve_async(...)'"
+            if config.lifetime is not ServiceLifetime.SINGLETON:
+                raise AsyncDependencyError(message)
+
+            # A singleton built by resolve_async() (or set with set_singleton) can still be handed out
+            resolver = compiled[interface] = _make_existing_singleton_resolver(config, message)
+            return resolver
+
+        # `resolving` is the stack of interfaces being compiled; the graph is shallow,
+        # so a list scan with append/pop is cheaper than copying a set per level
+        resolving.append(interface)
+        try:
+            arguments, complete = self._compile_arguments(config, registry, compiled, resolving, asynchronous)
+        finally:
+            resolving.pop()
+
+        if asynchronous:
+            build = _make_async_builder(config.provider, arguments, config.is_async)
+            guard = _guard_factory_async
+            resolve_singleton, resolve_scoped = self._resolve_singleton_async, self._resolve_scoped_async
+        else:
+            build = _make_builder(config.provider, arguments, config.positional and complete)
+            guard = _guard_factory
+            resolve_singleton, resolve_scoped = self._resolve_singleton, self._resolve_scoped
+        if not inspect.isclass(config.provider):
+            build = guard(build, interface, self._factories_ctx)
 
-        # Singleton Resolution (Thread-Safe)
         if config.lifetime == ServiceLifetime.SINGLETON:
-            return self._resolve_singleton(config, interface)
+            resolver = partial(resolve_singleton, build, config)
+        elif config.lifetime == ServiceLifetime.SCOPED:
+            resolver = partial(resolve_scoped, build, interface)
+        else:
+            resolver = build
 
-        # Scoped Resolution
-        if config.lifetime == ServiceLifetime.SCOPED:
-            return self._resolve_scoped(config, interface)
+        compiled[interface] = resolver
+        return resolver
 
-        # Transient Resolution
-        return self._create_instance(config, interface)
-
-    def _resolve_singleton[T](self, config: DependencyConfig[T], interface: type[T]) -> T:
-        # Double-checked locking optimization
-        if interface in self._singletons:
-            return self._singletons[interface]  # type: ignore
+    def _compile_arguments(
+        self,
+        config: DependencyConfig,
+        registry: dict[type, DependencyConfig],
+        compiled: dict[type, Callable[[], Any]],
+        resolving: list[type],
+        asynchronous: bool,
+    ) -> tuple[list[tuple[str, Callable[[], Any] | None, Any]], bool]:
+        """
+        Maps a provider's cached parameters to `(name, resolver, default)` entries.
 
-        with self._lock:
-            if interface in self._singletons:
-                return self._singletons[interface]  # type: ignore
+        Returns the entries together with a flag telling whether every parameter is covered.
+        """
+        registry_get = registry.get
+        arguments: list[tuple[str, Callable[[], Any] | None, Any]] = []
+        complete = True
+        for name, annotation, default in config.params:
+            if annotation is not None and registry_get(annotation):
+                # Registered dependency: reuse (or build) its compiled resolver
+                resolver = self._compile_node(annotation, registry, compiled, resolving, asynchronous)
+                arguments.append((name, resolver, _MISSING))
+            elif default is not _MISSING:
+                arguments.append((name, None, default))
+            else:
+                # Left out so the provider reports the missing argument itself
+                complete = False
+        return arguments, complete
+
+    def _resolve_singleton[T](self, build: Callable[[], T], config: DependencyConfig[T]) -> T:
+        # Double-checked locking optimization. Locks are per registration and the compiled graph
+        # is acyclic, so nested singletons take them in dependency order and cannot deadlock
+        instance = config.instance
+        if instance is not _MISSING:
+            return instance
 
-            instance = self._create_instance(config, interface)
-            self._singletons[interface] = instance
+        with config.lock:
+            instance = config.instance
+            if instance is not _MISSING:
+                return instance
+            if config.building:
+                # Only the thread holding the lock can get here: the provider resolved itself
+                raise CircularDependencyError(
+                    f"Circular dependency detected while building singleton {config.provider}"
+                )
+            config.building = True
+            try:
+                instance = config.instance = build()
+            finally:
+                config.building = False
             return instance
 
-    def _resolve_scoped[T](self, config: DependencyConfig[T], interface: type[T]) -> T:
+    def _resolve_scoped[T](self, build: Callable[[], T], interface: type[T]) -> T:
         scope = self._scope_ctx.get()
         if scope is not None:
-            if interface in scope:
-                return scope[interface]
+            instance = scope.get(interface, _MISSING)
+            if instance is not _MISSING:
+                return instance
 
-            instance = self._create_instance(config, interface)
+            instance = build()
             scope[interface] = instance
             return instance
 
         # If no manual scope, fall back to creating a new instance (Transient-like behavior outside scope)
-        return self._create_instance(config, interface)
+        return build()
+
+    async def _resolve_singleton_async[T](self, build: Callable[[], Awaitable[T]], config: DependencyConfig[T]) -> T:
+        instance = config.instance
+        if instance is not _MISSING:
+            return instance
+        return await self._build_singleton_once(config, build)
+
+    async def _build_singleton_once[T](self, config: DependencyConfig[T], build: Callable[[], Awaitable[T]]) -> T:
+        """
+        Builds an async singleton once and runs its on_startup hook before publishing it.
 
-    def _create_instance[T](self, config: DependencyConfig[T], interface: type[T]) -> T:
-        resolving = self._resolving_ctx.get()
-        new_resolving = set(resolving)
-        new_resolving.add(interface)
-        token = self._resolving_ctx.set(new_resolving)
+        The thread lock cannot be held across an await, so the first caller leaves a future on
+        the config and concurrent callers on the same event loop await it instead of building
+        again; nobody sees the instance before its hook has finished. A failed build is not
+        cached, and a cancelled one is retried by the callers that were waiting for it.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            with config.lock:
+                instance = config.instance
+                if instance is not _MISSING:
+                    return instance
+                pending = config.pending
+                if pending is None:
+                    pending = config.pending = loop.create_future()
+                    break
+
+            if pending.get_loop() is not loop:
+                # Built on another event loop; build here too and keep whichever is published first
+                instance = await build()
+                await self._run_startup_hooks(instance)
+                with config.lock:
+                    if config.instance is _MISSING:
+                        config.instance = instance
+                    return config.instance
+
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
 
         try:
-            provider = config.provider
-
-            # Determine signature to inspect
-            if inspect.isclass(provider):
-                sig = inspect.signature(provider.__init__)
-                # Remove self parameter for class __init__
-                params = [p for name, p in sig.parameters.items() if name != "self"]
-                sig = sig.replace(parameters=params)
+            instance = await build()
+            await self._run_startup_hooks(instance)
+        except BaseException as exc:
+            with config.lock:
+                config.pending = None
+            if isinstance(exc, asyncio.CancelledError):
+                pending.cancel()
             else:
-                sig = inspect.signature(provider)
-
-            # Resolve arguments
-            kwargs = {}
-            for name, param in sig.parameters.items():
-                if param.annotation != inspect.Parameter.empty and self.get_config(param.annotation):
-                    # Check if annotation is a registered dependency
-                    kwargs[name] = self.resolve(param.annotation)
-                    continue
-
-                # If not a dependency, check for default value
-                if param.default != inspect.Parameter.empty:
-                    kwargs[name] = param.default
-                    continue
-
-            return provider(**kwargs)
-        finally:
-            self._resolving_ctx.reset(token)
+                pending.set_exception(exc)
+                # Mark the exception as retrieved: there may be no other caller waiting for it
+                pending.exception()
+            raise
+
+        with config.lock:
+            if config.instance is _MISSING:
+                config.instance = instance
+            instance = config.instance
+            config.pending = None
+        pending.set_result(instance)
+        return instance
+
+    async def _resolve_scoped_async[T](self, build: Callable[[], Awaitable[T]], interface: type[T]) -> T:
+        scope = self._scope_ctx.get()
+        if scope is not None:
+            instance = scope.get(interface, _MISSING)
+            if instance is not _MISSING:
+                return instance
+
+            instance = await build()
+            return scope.setdefault(interface, instance)
+
+        return await build()
 
     async def _run_startup_hooks(self, instance: Any) -> None:
         """
         Runs the on_startup hook if present and not already run.
+
+        Whether a class defines a hook (and whether it is a coroutine) is looked up once per
+        class. For classes without one, a hook assigned on the instance itself
+        (`self.on_startup = ...`) is still honoured, at the cost of one attribute lookup.
         """
         if instance is None:
             return
 
+        cls = type(instance)
+        plan = self._startup_plans.get(cls)
+        if plan is None:
+            startup_method = getattr(cls, "on_startup", None)
+            plan = (callable(startup_method), inspect.iscoroutinefunction(startup_method))
+            self._startup_plans[cls] = plan
+
+        has_hook, is_coroutine = plan
+        if has_hook:
+            startup_method = instance.on_startup
+        else:
+            startup_method = getattr(instance, "on_startup", None)
+            if not callable(startup_method):
+                return
+            is_coroutine = inspect.iscoroutinefunction(startup_method)
+
         instance_id = id(instance)
         if instance_id in self._initialized_services:
             return
 
-        if hasattr(instance, "on_startup"):
-            startup_method = instance.on_startup
-            if callable(startup_method):
-                if inspect.iscoroutinefunction(startup_method):
-                    await startup_method()
-                else:
-                    startup_method()
+        if is_coroutine:
+            await startup_method()
+        else:
+            startup_method()
 
-        self._initialized_services.add(instance_id)
+        initialized = self._initialized_services
+        initialized.add(instance_id)
+        # Forget the id once the instance is collected, so the set stays bounded and a recycled
+        # id is never mistaken for an initialized service; objects without weakref support keep it
+        with suppress(TypeError):
+            weakref.finalize(instance, initialized.discard, instance_id)
 
     @contextmanager
     def scope(self) -> Generator[None, None, None]:
@@ -227,24 +551,40 @@ class Container:
         """
         Reset the container state, clearing all singletons and registry.
         Useful for testing.
+
+        The internal maps are swapped for fresh ones rather than cleared in place, and the old
+        registrations are left untouched, so resolutions already in progress keep working
+        against the snapshot they started with.
         """
-        self._registry.clear()
-        # self._resolving_ctx is context local, no need to reset
-        self._singletons.clear()
-        self._initialized_services.clear()
+        self._registry = {}
+        self._compiled = {}
+        self._compiled_async = {}
+        self._initialized_services = set()
+        self._startup_plans = {}
+        self._interfaces_by_provider = {}
+        self._dependency_markers = {}
 
     def get_singleton[T](self, interface: type[T]) -> T | None:
         """
         Retrieve a singleton instance if it exists.
         """
-        return self._singletons.get(interface)
+        config = self._registry.get(interface)
+        if config is None or config.instance is _MISSING:
+            return None
+        return config.instance
 
     def set_singleton[T](self, interface: type[T], instance: T) -> None:
         """
         Register a singleton instance.
+
+        Interfaces that are not registered yet are registered as singletons backed by the instance.
         """
-        with self._lock:
-            self._singletons[interface] = instance
+        config = self._registry.get(interface)
+        if config is None:
+            self.register(interface, lambda: instance, ServiceLifetime.SINGLETON)
+            config = self._registry[interface]
+        with config.lock:
+            config.instance = instance
 
 
 # Global default container
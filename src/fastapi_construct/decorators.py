@@ -2,20 +2,12 @@ import inspect
 import re
 import warnings
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, TypeVar, Unpack, get_args, get_origin
 
 from fastapi import APIRouter, Depends, Response
-from fastapi.responses import (
-    FileResponse,
-    HTMLResponse,
-    JSONResponse,
-    PlainTextResponse,
-    RedirectResponse,
-    StreamingResponse,
-)
-from starlette.responses import Response as StarletteResponse
-
-from .container import register_dependency
+
+from .container import _VARIADIC_KINDS, register_dependency
 from .enums import ServiceLifetime
 from .reflection import autowire_callable
 from .types import APIRouterArgs
@@ -23,6 +15,12 @@ from .types import APIRouterArgs
 
 T = TypeVar("T")
 
+# fastapi.Response is Starlette's Response, so HTMLResponse, JSONResponse, FileResponse, ... all derive from it
+_RESPONSE_BASES = (Response,)
+
+# Position before each inner capital letter, used to turn CamelCase into snake_case
+_CAMEL_CASE_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
 
 def injectable(
     interface: type[Any] | ServiceLifetime | None = None,
@@ -68,10 +66,16 @@ def injectable(
             Type[T]: The original class, unmodified but registered and configured for autowiring.
         """
         register_interface = interface if interface is not None else cls
+        has_own_init = "__init__" in cls.__dict__
+        if has_own_init:
+            # Build the constructor signature once; registration and autowiring read it back
+            # from __signature__ instead of introspecting __init__ again
+            cls.__init__.__signature__ = inspect.signature(cls.__init__)  # type: ignore
+
         register_dependency(register_interface, cls, lifetime)
 
         # Only autowire if __init__ is defined in the class (not inherited from object)
-        if "__init__" in cls.__dict__:
+        if has_own_init:
             autowire_callable(cls.__init__, owner_lifetime=lifetime)
 
         return cls
@@ -152,24 +156,44 @@ def controller(router: APIRouter | None = None, **kwargs: Unpack[APIRouterArgs])
         if "__init__" in cls.__dict__:
             autowire_callable(cls.__init__)
 
-        get_instance = _create_get_instance(cls)
+        # Built once and shared by every route instead of allocating a Depends per route
+        instance_dependency = Depends(_create_get_instance(cls))
 
-        members = inspect.getmembers(cls, predicate=inspect.isfunction)
-        # Sort by definition order (line number) to ensure routes are registered in the correct order
-        members.sort(key=lambda x: x[1].__code__.co_firstlineno)
-
-        for name, method in members:
-            if name.startswith("_"):
-                continue
-
-            if hasattr(method, "_route_metadata"):
-                _register_route(router, name, method, get_instance, controller_class=cls)
+        for name, method in _collect_route_methods(cls):
+            _register_route(router, name, method, instance_dependency, controller_class=cls)
 
         return cls
 
     return decorator
 
 
+def _collect_route_methods(cls: type) -> list[tuple[str, Callable[..., Any]]]:
+    """
+    Collect the public methods of a controller that carry route metadata, including inherited ones.
+
+    Walks the class dictionaries along the MRO instead of using `inspect.getmembers`, which
+    calls `getattr` for every name in `dir(cls)`. The first definition of a name wins, as with
+    normal attribute lookup, so an undecorated override hides a decorated base method.
+    Static methods are unwrapped to their function, as `getattr` would return it.
+    """
+    seen: set[str] = set()
+    routes = []
+    for klass in cls.__mro__:
+        if klass is object:
+            continue
+        for name, member in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            func = member.__func__ if isinstance(member, staticmethod) else member
+            if not name.startswith("_") and inspect.isfunction(func) and hasattr(func, "_route_metadata"):
+                routes.append((name, func))
+
+    # Sort by definition order (line number) to ensure routes are registered in the correct order
+    routes.sort(key=lambda x: x[1].__code__.co_firstlineno)
+    return routes
+
+
 def _create_get_instance[T](cls: type[T]) -> Callable[..., T]:
     """
     Helper to create the get_instance dependency factory.
@@ -185,11 +209,7 @@ def _create_get_instance[T](cls: type[T]) -> Callable[..., T]:
         # Get signature AFTER autowire_callable has modified it
         # This ensures we preserve the Depends() defaults that autowire_callable added
         init_sig = inspect.signature(cls.__init__)
-        init_params = [
-            p
-            for n, p in init_sig.parameters.items()
-            if n != "self" and p.kind not in {inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD}
-        ]
+        init_params = [p for n, p in init_sig.parameters.items() if n != "self" and p.kind not in _VARIADIC_KINDS]
         # Remove return annotation to avoid conflicts with FastAPI's dependency resolution
         # But keep the parameters as-is, including any Depends() defaults from autowire_callable
         get_instance.__signature__ = init_sig.replace(parameters=init_params, return_annotation=inspect.Signature.empty)  # type: ignore
@@ -205,16 +225,19 @@ def _register_route(
     router: APIRouter,
     name: str,
     method: Callable[..., Any],
-    get_instance: Callable[..., Any],
+    instance_dependency: Any,
     controller_class: type | None = None,
 ):
     """Helper to register a single route with automatic inference of metadata."""
+    # Copy: the decorator's dict is shared by every controller inheriting this method
     metadata = method._route_metadata.copy()  # type: ignore
+    path = metadata.pop("path")
+    method_verb = metadata.pop("method")
     sig = inspect.signature(method)
     return_annotation = sig.return_annotation
 
     # 1. Validate response_model consistency if explicitly set
-    _validate_response_model_consistency(method, metadata)
+    _validate_response_model_consistency(method, metadata, return_annotation)
 
     # 2. Infer response_model from return annotation if not explicitly set
     if "response_model" not in metadata and return_annotation is not inspect.Signature.empty:
@@ -245,7 +268,6 @@ def _register_route(
             metadata["description"] = description
 
     # 5. Infer status_code based on HTTP method and return type if not explicitly set
-    method_verb = metadata.get("method", "GET")
     if "status_code" not in metadata:
         inferred_status = _infer_status_code(method_verb, return_annotation)
         if inferred_status:
@@ -255,34 +277,45 @@ def _register_route(
     if "operation_id" not in metadata and controller_class:
         metadata["operation_id"] = _generate_operation_id(controller_class.__name__, name)
 
-    # Create a factory function to capture the current method name in the closure
-    def make_endpoint(method_name: str):
-        async def endpoint_wrapper(
-            **endpoint_kwargs,
-        ):
-            # Get controller instance from Depends
-            _controller_instance = endpoint_kwargs.pop("_controller_instance")
-            method_to_call = getattr(_controller_instance, method_name)
-            if inspect.iscoroutinefunction(method_to_call):
-                return await method_to_call(**endpoint_kwargs)
-            return method_to_call(**endpoint_kwargs)
-
-        return endpoint_wrapper
-
-    endpoint_wrapper = make_endpoint(name)
+    endpoint_wrapper = _create_endpoint(name, method, sig, instance_dependency)
+
+    router.add_api_route(path, endpoint_wrapper, methods=[method_verb], **metadata)
+
+
+def _create_endpoint(
+    name: str, method: Callable[..., Any], sig: inspect.Signature, instance_dependency: Any
+) -> Callable[..., Any]:
+    """
+    Helper to wrap a controller method into a FastAPI endpoint.
+
+    The endpoint receives the controller instance through the hidden `_controller_instance`
+    dependency and exposes the method's own parameters (without `self`) to FastAPI.
+    """
+    # Call the method's function directly with the controller instance, and choose the
+    # sync/async variant here so requests skip the getattr and iscoroutinefunction checks.
+    # The controller instance (from Depends) binds to its own keyword-only parameter, so the
+    # remaining kwargs can be forwarded without popping it out first
+    if inspect.iscoroutinefunction(method):
+
+        async def endpoint_wrapper(*, _controller_instance: Any, **endpoint_kwargs):
+            return await method(_controller_instance, **endpoint_kwargs)
+
+    else:
+
+        async def endpoint_wrapper(*, _controller_instance: Any, **endpoint_kwargs):
+            return method(_controller_instance, **endpoint_kwargs)
+
     endpoint_wrapper.__name__ = name
     endpoint_wrapper.__doc__ = method.__doc__
 
-    sig = inspect.signature(method)
-    # Skip 'self' parameter
-    params_list = list(sig.parameters.items())
-    params = [p for n, p in params_list if n != "self"]
+    # Skip 'self' parameter; sig is the signature _register_route already computed
+    params = [p for n, p in sig.parameters.items() if n != "self"]
 
     # Add controller instance parameter with include_in_schema=False
     controller_param = inspect.Parameter(
         "_controller_instance",
         inspect.Parameter.KEYWORD_ONLY,
-        default=Depends(get_instance),
+        default=instance_dependency,
     )
 
     # Set signature with method params + hidden controller instance
@@ -291,39 +324,32 @@ def _register_route(
         parameters=[*params, controller_param], return_annotation=inspect.Signature.empty
     )
 
-    path = metadata.pop("path")
-    method_verb = metadata.pop("method")
-
-    router.add_api_route(path, endpoint_wrapper, methods=[method_verb], **metadata)
+    return endpoint_wrapper
 
 
 def _contains_response(type_hint: Any) -> bool:
     """Helper to check if a type is or contains any Response class."""
-    # Check if it's any Response class
+    # Controllers tend to repeat the same return annotations, so memoize per type;
+    # unhashable hints (e.g. Annotated metadata holding a dict) take the uncached path
     try:
-        if isinstance(type_hint, type) and issubclass(
-            type_hint,
-            (
-                Response,
-                StarletteResponse,
-                HTMLResponse,
-                JSONResponse,
-                PlainTextResponse,
-                RedirectResponse,
-                FileResponse,
-                StreamingResponse,
-            ),
-        ):
-            return True
+        return _contains_response_cached(type_hint)
     except TypeError:
-        # Handle cases where issubclass can't be used
-        pass
-
-    # Handle Union, Optional, etc.
-    origin = getattr(type_hint, "__origin__", None)
-    if origin:
-        args = getattr(type_hint, "__args__", ())
-        return any(_contains_response(arg) for arg in args)
+        return _check_contains_response(type_hint)
+
+
+@lru_cache(maxsize=256)
+def _contains_response_cached(type_hint: Any) -> bool:
+    return _check_contains_response(type_hint)
+
+
+def _check_contains_response(type_hint: Any) -> bool:
+    # Check if it's any Response class; issubclass cannot raise once the hint is a real class
+    if isinstance(type_hint, type):
+        return issubclass(type_hint, _RESPONSE_BASES)
+
+    # Handle Union, Optional, etc. (get_origin also covers PEP 604 `X | Y` unions)
+    if get_origin(type_hint) is not None:
+        return any(_contains_response(arg) for arg in get_args(type_hint))
     return False
 
 
@@ -336,43 +362,14 @@ def _get_response_class_from_type(type_hint: Any) -> type[Response] | None:
     Keeping for potential future use.
     """
     # Check if it's a direct Response subclass
-    if isinstance(type_hint, type) and issubclass(
-        type_hint,
-        (
-            Response,
-            StarletteResponse,
-            HTMLResponse,
-            JSONResponse,
-            PlainTextResponse,
-            RedirectResponse,
-            FileResponse,
-            StreamingResponse,
-        ),
-    ):
+    if isinstance(type_hint, type) and issubclass(type_hint, _RESPONSE_BASES):
         return type_hint
 
     # Handle Union types - check if all non-None types are the same Response class
     origin = get_origin(type_hint)
     if origin is not None:
         args = get_args(type_hint)
-        response_classes = [
-            arg
-            for arg in args
-            if isinstance(arg, type)
-            and issubclass(
-                arg,
-                (
-                    Response,
-                    StarletteResponse,
-                    HTMLResponse,
-                    JSONResponse,
-                    PlainTextResponse,
-                    RedirectResponse,
-                    FileResponse,
-                    StreamingResponse,
-                ),
-            )
-        ]
+        response_classes = [arg for arg in args if isinstance(arg, type) and issubclass(arg, _RESPONSE_BASES)]
         if len(response_classes) == 1:
             return response_classes[0]
 
@@ -386,26 +383,13 @@ def _parse_docstring(func: Callable) -> tuple[str | None, str | None]:
     Returns:
         tuple: (summary, description) where summary is the first line and description is the rest
     """
-    if not func.__doc__:
+    doc = func.__doc__
+    if not doc:
         return None, None
 
-    lines = func.__doc__.strip().split("\n")
-    if not lines:
-        return None, None
-
-    # First non-empty line is the summary
-    summary = lines[0].strip()
-
-    # Rest is the description (skip empty lines at the beginning)
-    description_lines = []
-    for line in lines[1:]:
-        stripped = line.strip()
-        if stripped or description_lines:  # Start collecting after first non-empty line
-            description_lines.append(stripped)
-
-    description = "\n".join(description_lines).strip() if description_lines else None
-
-    return summary or None, description or None
+    # cleandoc dedents continuation lines, so relative indentation (lists, code) survives
+    summary, _, description = inspect.cleandoc(doc).partition("\n")
+    return summary.strip() or None, description.strip() or None
 
 
 def _infer_status_code(method_verb: str, return_annotation: Any) -> int | None:
@@ -433,7 +417,7 @@ def _infer_status_code(method_verb: str, return_annotation: Any) -> int | None:
     return None
 
 
-def _validate_response_model_consistency(method: Callable, metadata: dict) -> None:
+def _validate_response_model_consistency(method: Callable, metadata: dict, return_annotation: Any) -> None:
     """
     Validate that explicit response_model is consistent with return type annotation.
 
@@ -443,7 +427,6 @@ def _validate_response_model_consistency(method: Callable, metadata: dict) -> No
         return
 
     explicit_model = metadata["response_model"]
-    return_annotation = inspect.signature(method).return_annotation
 
     # Skip validation if no return annotation or if response_model is None
     if return_annotation is inspect.Signature.empty or explicit_model is None:
@@ -471,11 +454,11 @@ def _generate_operation_id(controller_name: str, method_name: str) -> str:
 
     Example: UserController.get_user -> "user_get_user"
     """
-    # Remove "Controller" suffix if present
+    # Remove "Controller" from the name (anywhere, not just as a suffix)
     clean_controller = controller_name.replace("Controller", "")
 
     # Convert CamelCase to snake_case
-    clean_controller = re.sub(r"(?<!^)(?=[A-Z])", "_", clean_controller).lower()
+    clean_controller = _CAMEL_CASE_BOUNDARY.sub("_", clean_controller).lower()
 
     return f"{clean_controller}_{method_name}"
 
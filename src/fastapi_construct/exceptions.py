@@ -18,6 +18,10 @@ class CircularDependencyError(DependencyError):
     """Raised when a circular dependency is detected."""
 
 
+class AsyncDependencyError(DependencyError):
+    """Raised when a dependency with an async provider is resolved synchronously."""
+
+
 class AutowireError(DependencyError):
     """Base exception for errors during autowiring."""
 
@@ -5,7 +5,7 @@ from typing import Any
 
 from fastapi import Depends
 
-from .container import default_container, get_dependency_config
+from .container import DependencyConfig, default_container, get_dependency_config
 from .enums import ServiceLifetime
 from .exceptions import CaptiveDependencyError, InterfaceMismatchError
 
@@ -36,21 +36,28 @@ def autowire_callable[F: Callable[..., Any]](func: F, owner_lifetime: ServiceLif
                    with helpful suggestions on how to fix it.
         CaptiveDependencyError: If a Scoped dependency is injected into a Singleton service.
     """
+    if _has_no_parameter_annotations(func):
+        return func
+
     sig: inspect.Signature = inspect.signature(func)
     new_params = []
     unresolved_params = []
+    changed = False
+    empty = inspect.Parameter.empty
+    # One dict probe per parameter instead of going through get_dependency_config/get_config
+    registry_get = default_container._registry.get
 
     for param in sig.parameters.values():
         if param.name == "self":
             new_params.append(param)
             continue
 
-        if param.annotation != inspect.Parameter.empty and param.default == inspect.Parameter.empty:
-            config = get_dependency_config(param.annotation)
+        if param.annotation is not empty and param.default is empty:
+            config = registry_get(param.annotation)
 
             if config:
                 # Validate Scoped in Singleton
-                if owner_lifetime == ServiceLifetime.SINGLETON and config.lifetime == ServiceLifetime.SCOPED:
+                if owner_lifetime is ServiceLifetime.SINGLETON and config.lifetime is ServiceLifetime.SCOPED:
                     func_name = getattr(func, "__qualname__", getattr(func, "__name__", str(func)))
                     param_type_name = getattr(param.annotation, "__name__", str(param.annotation))
                     raise CaptiveDependencyError(
@@ -62,16 +69,8 @@ def autowire_callable[F: Callable[..., Any]](func: F, owner_lifetime: ServiceLif
                         "3. Inject a factory or provider instead of the direct dependency."
                     )
 
-                if config.lifetime == ServiceLifetime.SINGLETON:
-                    # For Singletons, we need a proxy that checks the container for an existing instance
-                    # because FastAPI's use_cache=True is only request-scoped.
-                    proxy = _create_singleton_proxy(config.provider, param.annotation)
-                    new_params.append(param.replace(default=Depends(proxy, use_cache=False)))
-                else:
-                    use_cache = config.lifetime != ServiceLifetime.TRANSIENT
-                    # Wrap provider to support async initialization (on_startup)
-                    wrapper = _create_async_wrapper(config.provider)
-                    new_params.append(param.replace(default=Depends(wrapper, use_cache=use_cache)))
+                new_params.append(param.replace(default=_dependency_marker(config, param.annotation)))
+                changed = True
                 continue
 
             # Check if this type is registered under a different interface
@@ -102,57 +101,110 @@ def autowire_callable[F: Callable[..., Any]](func: F, owner_lifetime: ServiceLif
 
         raise InterfaceMismatchError("".join(error_parts))
 
-    func.__signature__ = sig.replace(parameters=new_params)  # type: ignore
+    # Store the signature even when nothing was injected so later inspect.signature calls are cheap
+    func.__signature__ = sig.replace(parameters=new_params) if changed else sig  # type: ignore
     return func
 
 
+def _has_no_parameter_annotations(func: Callable[..., Any]) -> bool:
+    """
+    Cheap pre-check that lets autowire_callable skip building a signature it cannot change.
+
+    Only plain functions qualify: anything with `__wrapped__` may expose different parameters
+    than its own code object, so it takes the full path. An explicit `__signature__` (such as the
+    one @injectable stamps on `__init__`) is checked directly instead of the code's annotations.
+    """
+    if getattr(func, "__code__", None) is None or hasattr(func, "__wrapped__"):
+        return False
+    signature = getattr(func, "__signature__", None)
+    if signature is not None:
+        return isinstance(signature, inspect.Signature) and all(
+            param.annotation is inspect.Parameter.empty for param in signature.parameters.values()
+        )
+    annotations = getattr(func, "__annotations__", None)
+    return annotations is not None and annotations.keys() <= {"return"}
+
+
 def _find_registered_interface(implementation: type[Any]) -> type[Any] | None:
     """
     Check if the given implementation type is registered in the container under a different interface.
 
     Returns the interface type if found, None otherwise.
     """
-    # Iterate through all registered dependencies to find if this implementation is registered
-    for registered_type in default_container._registry:
-        config = get_dependency_config(registered_type)
-        if config and inspect.isclass(config.provider):
-            # Check if the provider is the same as or a subclass of the implementation
-            if config.provider == implementation or (
-                inspect.isclass(implementation) and issubclass(implementation, config.provider)
-            ):
-                return registered_type
-            # Also check if implementation is the provider itself
-            if implementation == config.provider:
+    if not inspect.isclass(implementation):
+        return None
+
+    # Look up the implementation and each of its bases in the provider index instead of
+    # scanning the whole registry; the most specific registered provider wins
+    registry = default_container._registry
+    interfaces_by_provider = default_container._interfaces_by_provider
+    for base in implementation.__mro__:
+        for registered_type in interfaces_by_provider.get(base, ()):
+            config = registry.get(registered_type)
+            if config is not None and config.provider is base:
                 return registered_type
 
     return None
 
 
+def _dependency_marker(config: DependencyConfig[Any], interface: Any) -> Any:
+    """Returns the Depends marker that injects the dependency registered by config for interface."""
+    # Enum members are singletons, so identity checks are enough to pick the lifetime
+    is_singleton = config.lifetime is ServiceLifetime.SINGLETON
+    # Markers are built once per registration and shared by every parameter that needs them,
+    # which also saves copying the provider signature again. The cache lives on the container,
+    # so reset() drops it along with the registrations it was built from
+    key = (config.provider, config.lifetime, interface)
+    markers = default_container._dependency_markers
+    try:
+        marker = markers.get(key)
+    except TypeError:
+        # Unhashable providers are simply wrapped on each call
+        return _build_dependency_marker(config, interface, is_singleton)
+
+    if marker is None:
+        marker = markers[key] = _build_dependency_marker(config, interface, is_singleton)
+    return marker
+
+
+def _build_dependency_marker(config: DependencyConfig[Any], interface: Any, is_singleton: bool) -> Any:
+    if is_singleton:
+        # For Singletons, we need a proxy that checks the container for an existing instance
+        # because FastAPI's use_cache=True is only request-scoped.
+        return Depends(_create_singleton_proxy(config.provider, interface), use_cache=False)
+
+    # Wrap provider to support async initialization (on_startup); only Scoped reuses the
+    # instance for the rest of the request
+    wrapper = _create_async_wrapper(config.provider)
+    return Depends(wrapper, use_cache=config.lifetime is ServiceLifetime.SCOPED)
+
+
 def _create_singleton_proxy(provider: Callable[..., Any], interface: type[Any]) -> Callable[..., Any]:
     """
     Creates a proxy function for Singleton dependencies.
 
     This proxy checks the container for an existing instance before creating a new one.
     It mimics the signature of the provider so FastAPI can inject dependencies into it.
+    Coroutine providers (async factories) are awaited.
     """
+    is_async = inspect.iscoroutinefunction(provider)
 
     async def proxy(**kwargs):
-        # Fast check without lock
         instance = default_container.get_singleton(interface)
         if instance is not None:
             return instance
 
-        # Acquire lock and check again (Double-Checked Locking)
-        # We access the lock directly from the container to ensure process-wide safety
-        with default_container._lock:
-            instance = default_container.get_singleton(interface)
-            if instance is not None:
-                return instance
-
+        async def build():
             instance = provider(**kwargs)
+            return await instance if is_async else instance
+
+        config = default_container.get_config(interface)
+        if config is None:
+            instance = await build()
             await default_container._run_startup_hooks(instance)
-            default_container.set_singleton(interface, instance)
             return instance
+        # Concurrent requests share one build, and see the instance only after on_startup ran
+        return await default_container._build_singleton_once(config, build)
 
     _copy_signature(provider, proxy)
     return proxy
@@ -161,7 +213,8 @@ def _create_singleton_proxy(provider: Callable[..., Any], interface: type[Any])
 def _create_async_wrapper(provider: Callable[..., Any]) -> Callable[..., Any]:
     """
     Creates a wrapper function to support async initialization (on_startup).
-    Handles AsyncGenerators by yielding the value and ensuring cleanup.
+    Handles AsyncGenerators by yielding the value and ensuring cleanup,
+    and awaits coroutine providers (async factories).
     """
     if inspect.isasyncgenfunction(provider):
 
@@ -185,6 +238,13 @@ def _create_async_wrapper(provider: Callable[..., Any]) -> Callable[..., Any]:
                 finally:
                     await gen.aclose()
 
+    elif inspect.iscoroutinefunction(provider):
+
+        async def wrapper(**kwargs):
+            instance = await provider(**kwargs)
+            await default_container._run_startup_hooks(instance)
+            return instance
+
     else:
 
         async def wrapper(**kwargs):
@@ -219,11 +279,5 @@ def resolve_dependency_for_param(annotation: Any) -> Any:
     """
     config = get_dependency_config(annotation)
     if config:
-        if config.lifetime == ServiceLifetime.SINGLETON:
-            proxy = _create_singleton_proxy(config.provider, annotation)
-            return Depends(proxy, use_cache=False)
-
-        use_cache = config.lifetime != ServiceLifetime.TRANSIENT
-        wrapper = _create_async_wrapper(config.provider)
-        return Depends(wrapper, use_cache=use_cache)
+        return _dependency_marker(config, annotation)
     return annotation
@@ -1,6 +1,5 @@
 """Test the exact auth pattern that was failing."""
-import warnings
-
+import pytest
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 from pydantic import BaseModel
@@ -107,8 +106,7 @@ def test_auth_controller_without_explicit_response_model():
 def test_validation_warning_is_emitted():
     """Test that validation warning is emitted for inconsistent types."""
 
-    with warnings.catch_warnings(record=True) as w:
-        warnings.simplefilter("always")
+    with pytest.warns(UserWarning, match="Inconsistent response_model") as record:
 
         @controller(prefix="/test")
         class TestController:
@@ -116,6 +114,5 @@ def test_validation_warning_is_emitted():
             async def endpoint(self) -> UserResponse:  # Inconsistent!
                 return UserResponse(id=1, name="Test", email="test@example.com")
 
-        # Should have emitted a warning
-        assert len(w) == 1
-        assert "Inconsistent response_model" in str(w[0].message)
+    # Should have emitted exactly one warning
+    assert len(record) == 1
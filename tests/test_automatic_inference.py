@@ -1,7 +1,6 @@
 """Tests for automatic inference of metadata (status_code, summary, description, operation_id, response_class)."""
 
-import warnings
-
+import pytest
 from fastapi import FastAPI
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.testclient import TestClient
@@ -97,6 +96,29 @@ def test_summary_and_description_from_docstring():
     assert "Retrieve detailed information" in endpoint["description"]
 
 
+def test_description_keeps_relative_indentation():
+    """Test that nested docstring lines keep their indentation relative to the docstring."""
+
+    @controller(prefix="/reports")
+    class ReportController:
+        @get("/")
+        def list_reports(self) -> list[str]:
+            """List reports.
+
+            Supported filters:
+                - owner
+                - status
+            """
+            return []
+
+    app = FastAPI()
+    app.include_router(ReportController.router)
+
+    endpoint = app.openapi()["paths"]["/reports/"]["get"]
+    assert endpoint["summary"] == "List reports."
+    assert endpoint["description"] == "Supported filters:\n    - owner\n    - status"
+
+
 def test_summary_explicit_takes_precedence():
     """Test that explicit summary/description takes precedence over docstring."""
 
@@ -137,9 +159,9 @@ def test_operation_id_generation():
     app.include_router(UserController.router)
 
     # Check OpenAPI schema
-    openapi = app.openapi()
-    assert "user_get_user_by_id" in openapi["paths"]["/users/{user_id}"]["get"]["operationId"]
-    assert "user_create_new_user" in openapi["paths"]["/users/"]["post"]["operationId"]
+    paths = app.openapi()["paths"]
+    assert "user_get_user_by_id" in paths["/users/{user_id}"]["get"]["operationId"]
+    assert "user_create_new_user" in paths["/users/"]["post"]["operationId"]
 
 
 def test_operation_id_camelcase_conversion():
@@ -160,6 +182,22 @@ def test_operation_id_camelcase_conversion():
     assert operation_id == "item_management_get_item"
 
 
+def test_operation_id_strips_controller_anywhere_in_name():
+    """Test that "Controller" is removed even when it is not a suffix, keeping existing operation IDs stable."""
+
+    @controller(prefix="/admin")
+    class AdminControllerV2:
+        @get("/")
+        def list_users(self) -> list[UserResponse]:
+            return []
+
+    app = FastAPI()
+    app.include_router(AdminControllerV2.router)
+
+    operation_id = app.openapi()["paths"]["/admin/"]["get"]["operationId"]
+    assert operation_id == "admin_v2_list_users"
+
+
 def test_operation_id_explicit_takes_precedence():
     """Test that explicit operation_id takes precedence."""
 
@@ -173,8 +211,8 @@ def test_operation_id_explicit_takes_precedence():
     app.include_router(UserController.router)
 
     # Check OpenAPI schema
-    openapi = app.openapi()
-    assert openapi["paths"]["/users/{user_id}"]["get"]["operationId"] == "custom_operation_id"
+    endpoint = app.openapi()["paths"]["/users/{user_id}"]["get"]
+    assert endpoint["operationId"] == "custom_operation_id"
 
 
 def test_response_subclass_disables_response_model():
@@ -209,8 +247,7 @@ def test_response_subclass_disables_response_model():
 def test_response_model_inconsistency_warning():
     """Test that inconsistent response_model and return type emit a warning."""
 
-    with warnings.catch_warnings(record=True) as w:
-        warnings.simplefilter("always")
+    with pytest.warns(UserWarning, match="Inconsistent response_model") as record:
 
         @controller(prefix="/users")
         class UserController:
@@ -218,10 +255,8 @@ def test_response_model_inconsistency_warning():
             def get_user(self, user_id: int) -> UserResponse:  # Inconsistent!
                 return UserResponse(id=user_id, name="John Doe")
 
-        # Check that a warning was raised
-        assert len(w) == 1
-        assert issubclass(w[0].category, UserWarning)
-        assert "Inconsistent response_model" in str(w[0].message)
+    # Check that exactly one warning was raised
+    assert len(record) == 1
 
 
 def test_all_inferences_together():
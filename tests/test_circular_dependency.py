@@ -4,45 +4,48 @@ from fastapi_construct.container import Container
 from fastapi_construct.exceptions import CircularDependencyError
 
 
-class TestCircularDependency:
-    """Tests for circular dependency detection."""
+class IA:
+    pass
 
-    def test_circular_dependency_raises_error(self):
-        """Test that a simple A -> B -> A cycle raises CircularDependencyError."""
-        container = Container()
 
-        class IA:
-            pass
+class IB:
+    pass
 
-        class IB:
-            pass
 
-        class A:
-            def __init__(self, b: IB):
-                self.b = b
+class A:
+    def __init__(self, b: IB):
+        self.b = b
 
-        class B:
-            def __init__(self, a: IA):
-                self.a = a
 
-        container.register(IA, A)
-        container.register(IB, B)
+class B:
+    def __init__(self, a: IA):
+        self.a = a
 
-        with pytest.raises(CircularDependencyError):
-            container.resolve(IA)
 
-    def test_self_dependency_raises_error(self):
-        """Test that A -> A cycle raises CircularDependencyError."""
-        container = Container()
+class SelfA:
+    def __init__(self, a: IA):
+        self.a = a
 
-        class IA:
-            pass
 
-        class A:
-            def __init__(self, a: IA):
-                self.a = a
+@pytest.fixture
+def container() -> Container:
+    return Container()
+
+
+class TestCircularDependency:
+    """Tests for circular dependency detection."""
 
-        container.register(IA, A)
+    @pytest.mark.parametrize(
+        "registrations",
+        [
+            pytest.param([(IA, A), (IB, B)], id="a-b-a"),
+            pytest.param([(IA, SelfA)], id="self"),
+        ],
+    )
+    def test_cycle_raises_error(self, container: Container, registrations: list[tuple[type, type]]):
+        """Test that A -> B -> A and A -> A cycles raise CircularDependencyError."""
+        for interface, provider in registrations:
+            container.register(interface, provider)
 
         with pytest.raises(CircularDependencyError):
             container.resolve(IA)
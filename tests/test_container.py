@@ -11,10 +11,10 @@ from fastapi_construct.enums import ServiceLifetime
 
 @pytest.fixture(autouse=True)
 def clear_registry() -> Generator[None, Any, None]:
-    """Clear the dependency registry before and after each test."""
-    container.default_container._registry.clear()
+    """Reset the default container (registry, compiled resolvers, singletons) before and after each test."""
+    container.default_container.reset()
     yield
-    container.default_container._registry.clear()
+    container.default_container.reset()
 
 
 class TestTransientLifetime:
@@ -1,7 +1,10 @@
+import asyncio
+
 import pytest
 
 from fastapi_construct.container import Container
-from fastapi_construct.exceptions import DependencyNotFoundError, DependencyRegistrationError
+from fastapi_construct.enums import ServiceLifetime
+from fastapi_construct.exceptions import CircularDependencyError, DependencyNotFoundError, DependencyRegistrationError
 
 
 class TestContainerClass:
@@ -63,3 +66,138 @@ class TestContainerClass:
         container.register(IService, Service)
         instance = container.resolve(IService)
         assert isinstance(instance, Service)
+
+    def test_register_caches_provider_parameters(self):
+        """Test that provider parameters are introspected once at registration time."""
+        container = Container()
+
+        class IRepo:
+            pass
+
+        class Repo:
+            pass
+
+        class IService:
+            pass
+
+        class Service:
+            def __init__(self, repo: IRepo, name: str = "default", *args, **kwargs):
+                self.repo = repo
+                self.name = name
+
+        container.register(IRepo, Repo)
+        container.register(IService, Service)
+
+        cfg = container.get_config(IService)
+        assert [name for name, _, _ in cfg.params] == ["repo", "name"]
+
+        instance = container.resolve(IService)
+        assert isinstance(instance.repo, Repo)
+        assert instance.name == "default"
+
+    def test_resolve_singleton_depending_on_singleton(self):
+        """Test that nested singleton resolution does not deadlock and reuses instances."""
+        container = Container()
+
+        class IConfig:
+            pass
+
+        class Config:
+            pass
+
+        class IClient:
+            pass
+
+        class Client:
+            def __init__(self, config: IConfig):
+                self.config = config
+
+        container.register(IConfig, Config, ServiceLifetime.SINGLETON)
+        container.register(IClient, Client, ServiceLifetime.SINGLETON)
+
+        client = container.resolve(IClient)
+        assert client is container.resolve(IClient)
+        assert client.config is container.resolve(IConfig)
+
+    def test_register_invalidates_compiled_resolvers(self):
+        """Test that re-registering an interface is picked up by dependents resolved earlier."""
+        container = Container()
+
+        class IRepo:
+            pass
+
+        class Repo1:
+            pass
+
+        class Repo2:
+            pass
+
+        class Service:
+            def __init__(self, repo: IRepo):
+                self.repo = repo
+
+        container.register(IRepo, Repo1)
+        container.register(Service, Service)
+        assert isinstance(container.resolve(Service).repo, Repo1)
+
+        container.register(IRepo, Repo2)
+        assert isinstance(container.resolve(Service).repo, Repo2)
+
+    def test_resolve_provider_with_keyword_only_parameters(self):
+        """Test that keyword-only provider parameters are still injected by name."""
+        container = Container()
+
+        class IRepo:
+            pass
+
+        class Repo:
+            pass
+
+        def make_service(*, repo: IRepo, retries: int = 3) -> dict:
+            return {"repo": repo, "retries": retries}
+
+        container.register(IRepo, Repo)
+        container.register(dict, make_service)
+
+        service = container.resolve(dict)
+        assert isinstance(service["repo"], Repo)
+        assert service["retries"] == 3
+
+    def test_singleton_factory_resolving_itself_raises(self):
+        """Test that a singleton factory resolving its own interface raises instead of deadlocking."""
+        container = Container()
+
+        class Config:
+            pass
+
+        def create_config() -> Config:
+            return container.resolve(Config)
+
+        container.register(Config, create_config, ServiceLifetime.SINGLETON)
+
+        with pytest.raises(CircularDependencyError):
+            container.resolve(Config)
+        assert container.get_singleton(Config) is None
+
+    def test_factory_cycle_detected_at_runtime(self):
+        """Test that cycles through factories calling back into the container raise, sync and async."""
+        container = Container()
+
+        class IA:
+            pass
+
+        class IB:
+            pass
+
+        container.register(IA, lambda: container.resolve(IB), ServiceLifetime.TRANSIENT)
+        container.register(IB, lambda: container.resolve(IA), ServiceLifetime.SCOPED)
+
+        with pytest.raises(CircularDependencyError):
+            container.resolve(IA)
+
+        async def create_a() -> IA:
+            return await container.resolve_async(IA)
+
+        container.register(IA, create_a, ServiceLifetime.TRANSIENT)
+        with pytest.raises(CircularDependencyError):
+            asyncio.run(container.resolve_async(IA))
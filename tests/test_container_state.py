@@ -1,6 +1,11 @@
+import asyncio
+import gc
+
 import pytest
 
 from fastapi_construct import Container, ServiceLifetime
+from fastapi_construct import container as container_module
+from fastapi_construct.reflection import resolve_dependency_for_param
 
 
 def test_container_reset_clears_singletons():
@@ -51,3 +56,144 @@ def test_container_isolation():
     instance2 = container2.resolve(IService)
 
     assert instance1 is not instance2
+
+
+def test_singleton_shared_between_resolve_and_accessors():
+    container = Container()
+
+    class IService:
+        pass
+
+    class Service:
+        pass
+
+    container.register(IService, Service, ServiceLifetime.SINGLETON)
+    assert container.get_singleton(IService) is None
+
+    instance = container.resolve(IService)
+    assert container.get_singleton(IService) is instance
+
+    replacement = Service()
+    container.set_singleton(IService, replacement)
+    assert container.resolve(IService) is replacement
+
+
+def test_set_singleton_registers_unknown_interface():
+    container = Container()
+
+    class IService:
+        pass
+
+    instance = IService()
+    container.set_singleton(IService, instance)
+
+    assert container.get_singleton(IService) is instance
+    assert container.resolve(IService) is instance
+
+
+def test_startup_tracking_released_with_instance():
+    container = Container()
+
+    class Service:
+        def __init__(self):
+            self.started = False
+
+        def on_startup(self):
+            self.started = True
+
+    container.register(Service, Service, ServiceLifetime.TRANSIENT)
+
+    instance = asyncio.run(container.resolve_async(Service))
+    assert instance.started is True
+    assert id(instance) in container._initialized_services
+
+    instance_id = id(instance)
+    del instance
+    gc.collect()
+    assert instance_id not in container._initialized_services
+
+
+def test_startup_hook_assigned_on_instance_runs():
+    container = Container()
+
+    class Service:
+        def __init__(self):
+            self.started = False
+            self.on_startup = self.start
+
+        def start(self):
+            self.started = True
+
+    container.register(Service, Service, ServiceLifetime.TRANSIENT)
+
+    assert asyncio.run(container.resolve_async(Service)).started is True
+
+
+def test_reset_clears_startup_plans():
+    container = Container()
+
+    class Service:
+        def on_startup(self):
+            pass
+
+    container.register(Service, Service, ServiceLifetime.TRANSIENT)
+    asyncio.run(container.resolve_async(Service))
+    assert Service in container._startup_plans
+
+    container.reset()
+    assert not container._startup_plans
+
+
+def test_singleton_proxy_builds_once_under_concurrency():
+    container_module.default_container.reset()
+
+    class Database:
+        pass
+
+    async def create_database() -> Database:
+        await asyncio.sleep(0)
+        return Database()
+
+    container_module.add_singleton(Database, create_database)
+    proxy = resolve_dependency_for_param(Database).dependency
+
+    async def run():
+        return await asyncio.gather(*(proxy() for _ in range(5)))
+
+    instances = asyncio.run(run())
+    assert all(instance is instances[0] for instance in instances)
+    assert container_module.default_container.get_singleton(Database) is instances[0]
+    container_module.default_container.reset()
+
+
+def test_singleton_proxy_runs_async_startup_once_before_sharing():
+    container_module.default_container.reset()
+    builds = []
+
+    class Database:
+        def __init__(self):
+            self.ready = False
+            self.startups = 0
+
+        async def on_startup(self):
+            self.startups += 1
+            await asyncio.sleep(0.01)
+            self.ready = True
+
+    async def create_database() -> Database:
+        builds.append(1)
+        await asyncio.sleep(0)
+        return Database()
+
+    container_module.add_singleton(Database, create_database)
+    proxy = resolve_dependency_for_param(Database).dependency
+
+    async def run():
+        return await asyncio.gather(*(proxy() for _ in range(5)))
+
+    instances = asyncio.run(run())
+    assert len(builds) == 1
+    assert all(instance is instances[0] for instance in instances)
+    assert all(instance.ready for instance in instances)
+    assert instances[0].startups == 1
+    container_module.default_container.reset()
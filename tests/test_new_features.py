@@ -1,6 +1,11 @@
 import asyncio
 
-from fastapi_construct import ServiceLifetime, container, injectable
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_construct import ServiceLifetime, container, inject, injectable
+from fastapi_construct.exceptions import AsyncDependencyError
 
 
 # We define classes inside tests or re-register them to ensure they exist in the registry
@@ -27,6 +32,26 @@ def test_async_init():
     asyncio.run(run_test())
 
 
+def test_sync_startup_hook_runs_once():
+    container.default_container.reset()
+
+    @injectable(ServiceLifetime.SINGLETON)
+    class CounterService:
+        def __init__(self):
+            self.startups = 0
+
+        def on_startup(self):
+            self.startups += 1
+
+    async def run_test():
+        first = await container.default_container.resolve_async(CounterService)
+        second = await container.default_container.resolve_async(CounterService)
+        assert first is second
+        assert first.startups == 1
+
+    asyncio.run(run_test())
+
+
 def test_manual_scope():
     container.default_container.reset()
 
@@ -56,6 +81,150 @@ def test_manual_scope():
         assert s6 is not s3
 
 
+def test_async_factory_resolution():
+    container.default_container.reset()
+
+    class Settings:
+        pass
+
+    class Session:
+        def __init__(self, settings: Settings):
+            self.settings = settings
+
+    async def create_session(settings: Settings) -> Session:
+        await asyncio.sleep(0)
+        return Session(settings)
+
+    container.add_singleton(Settings, Settings)
+    container.add_scoped(Session, create_session)
+
+    async def run_test():
+        session = await container.default_container.resolve_async(Session)
+        assert isinstance(session, Session)
+        assert session.settings is await container.default_container.resolve_async(Settings)
+
+    asyncio.run(run_test())
+
+
+def test_sync_resolve_rejects_async_factory():
+    container.default_container.reset()
+
+    class Database:
+        pass
+
+    async def create_database() -> Database:
+        return Database()
+
+    class Repository:
+        def __init__(self, db: Database):
+            self.db = db
+
+    container.add_singleton(Database, create_database)
+    container.add_scoped(Repository, Repository)
+
+    with pytest.raises(AsyncDependencyError, match="resolve_async"):
+        container.default_container.resolve(Database)
+    with pytest.raises(AsyncDependencyError):
+        container.default_container.resolve(Repository)
+
+    # Nothing was cached by the failed synchronous attempts
+    assert container.default_container.get_singleton(Database) is None
+    database = asyncio.run(container.default_container.resolve_async(Database))
+    assert isinstance(database, Database)
+
+    # Once the singleton exists, synchronous resolution hands it out
+    assert container.default_container.resolve(Database) is database
+    assert container.default_container.resolve(Repository).db is database
+
+
+def test_async_factory_injected_into_endpoint():
+    container.default_container.reset()
+
+    class Session:
+        def __init__(self, name: str):
+            self.name = name
+
+    async def create_session() -> Session:
+        await asyncio.sleep(0)
+        return Session("async")
+
+    container.add_scoped(Session, create_session)
+
+    @inject
+    def read_session(session: Session) -> str:
+        return session.name
+
+    app = FastAPI()
+
+    @app.get("/session")
+    def endpoint(name: str = Depends(read_session)):
+        return {"name": name}
+
+    response = TestClient(app).get("/session")
+    assert response.status_code == 200
+    assert response.json() == {"name": "async"}
+
+
+def test_scoped_dependency_shared_within_request():
+    container.default_container.reset()
+
+    @injectable(ServiceLifetime.SCOPED)
+    class UnitOfWork:
+        pass
+
+    @injectable(ServiceLifetime.SCOPED)
+    class OrderService:
+        def __init__(self, uow: UnitOfWork):
+            self.uow = uow
+
+    @injectable(ServiceLifetime.SCOPED)
+    class BillingService:
+        def __init__(self, uow: UnitOfWork):
+            self.uow = uow
+
+    @inject
+    def same_unit_of_work(orders: OrderService, billing: BillingService) -> bool:
+        return orders.uow is billing.uow
+
+    app = FastAPI()
+
+    @app.get("/uow")
+    def endpoint(shared: bool = Depends(same_unit_of_work)):
+        return {"shared": shared}
+
+    response = TestClient(app).get("/uow")
+    assert response.json() == {"shared": True}
+
+
+def test_scoped_interfaces_sharing_a_provider_get_separate_instances():
+    container.default_container.reset()
+
+    class IReader:
+        pass
+
+    class IWriter:
+        pass
+
+    class Store:
+        pass
+
+    container.add_scoped(IReader, Store)
+    container.add_scoped(IWriter, Store)
+
+    @inject
+    def same_store(reader: IReader, writer: IWriter) -> bool:
+        return reader is writer
+
+    app = FastAPI()
+
+    @app.get("/store")
+    def endpoint(same: bool = Depends(same_store)):
+        return {"same": same}
+
+    response = TestClient(app).get("/store")
+    assert response.json() == {"same": False}
+
+
 if __name__ == "__main__":
     test_manual_scope()
     test_async_init()
@@ -6,17 +6,17 @@ from typing import Any
 
 import pytest
 
-from fastapi_construct import container
+from fastapi_construct import ServiceLifetime, container, injectable
 from fastapi_construct.exceptions import CaptiveDependencyError, InterfaceMismatchError
-from fastapi_construct.reflection import autowire_callable, resolve_dependency_for_param
+from fastapi_construct.reflection import _has_no_parameter_annotations, autowire_callable, resolve_dependency_for_param
 
 
 @pytest.fixture(autouse=True)
 def clear_registry() -> Generator[None, Any, None]:
-    """Clear the dependency registry before and after each test."""
-    container.default_container._registry.clear()
+    """Reset the default container (registry, compiled resolvers, singletons) before and after each test."""
+    container.default_container.reset()
     yield
-    container.default_container._registry.clear()
+    container.default_container.reset()
 
 
 class TestResolveDependencyForParam:
@@ -400,6 +400,113 @@ class TestAutowireEdgeCases:
         assert "registered as 'IService'" in error_msg
         assert "Change the type annotation" in error_msg
 
+    def test_autowire_skips_functions_without_parameter_annotations(self) -> None:
+        """Test that functions with nothing to inject are returned without a rebuilt signature."""
+
+        def handler(name, count=1) -> str:  # type: ignore
+            return name * count
+
+        assert autowire_callable(handler) is handler
+        assert "__signature__" not in handler.__dict__
+        assert list(inspect.signature(handler).parameters) == ["name", "count"]
+
+    def test_autowire_shares_depends_marker_per_dependency(self) -> None:
+        """Test that every parameter injecting the same dependency reuses one Depends marker."""
+
+        class IService:
+            pass
+
+        class ServiceImpl:
+            pass
+
+        container.add_scoped(IService, ServiceImpl)
+
+        def first(svc: IService) -> None:
+            pass
+
+        def second(svc: IService) -> None:
+            pass
+
+        autowire_callable(first)
+        autowire_callable(second)
+
+        first_default = inspect.signature(first).parameters["svc"].default
+        assert first_default is inspect.signature(second).parameters["svc"].default
+        assert resolve_dependency_for_param(IService) is first_default
+
+    def test_reset_drops_cached_depends_markers(self) -> None:
+        """Test that reset() releases the markers built for the previous registrations."""
+
+        class IService:
+            pass
+
+        class ServiceImpl:
+            pass
+
+        container.add_singleton(IService, ServiceImpl)
+        marker = resolve_dependency_for_param(IService)
+        assert container.default_container._dependency_markers
+
+        container.default_container.reset()
+        assert not container.default_container._dependency_markers
+
+        container.add_singleton(IService, ServiceImpl)
+        assert resolve_dependency_for_param(IService) is not marker
+
+    def test_stamped_signature_keeps_unannotated_fast_path(self) -> None:
+        """Test that the signature @injectable stamps on __init__ still allows skipping autowiring."""
+
+        @injectable(ServiceLifetime.TRANSIENT)
+        class PlainService:
+            def __init__(self, name="plain") -> None:
+                self.name = name
+
+        class IService:
+            pass
+
+        container.add_scoped(IService, PlainService)
+
+        @injectable(ServiceLifetime.TRANSIENT)
+        class DependentService:
+            def __init__(self, svc: IService) -> None:
+                self.svc = svc
+
+        assert _has_no_parameter_annotations(PlainService.__init__)
+        assert not _has_no_parameter_annotations(DependentService.__init__)
+
+    def test_autowire_interface_mismatch_uses_current_registration(self) -> None:
+        """Test that implementation subclasses are detected and replaced providers are ignored."""
+
+        class IService:
+            pass
+
+        class ServiceImpl:
+            pass
+
+        class SpecialServiceImpl(ServiceImpl):
+            pass
+
+        class OtherImpl:
+            pass
+
+        container.add_scoped(IService, ServiceImpl)
+
+        class SubclassInjection:
+            def __init__(self, svc: SpecialServiceImpl) -> None:
+                self.svc = svc
+
+        with pytest.raises(InterfaceMismatchError, match="registered as 'IService'"):
+            autowire_callable(SubclassInjection.__init__)
+
+        # Once IService points at another provider, ServiceImpl is no longer a registered implementation
+        container.add_scoped(IService, OtherImpl)
+
+        class StaleInjection:
+            def __init__(self, svc: ServiceImpl) -> None:
+                self.svc = svc
+
+        autowire_callable(StaleInjection.__init__)
+
     def test_autowire_raises_error_for_scoped_in_singleton(self) -> None:
         """Test that injecting a Scoped dependency into a Singleton raises CaptiveDependencyError."""
 
@@ -1,8 +1,11 @@
+from typing import Annotated
+
 from fastapi import FastAPI, Response
 from fastapi.testclient import TestClient
 from pydantic import BaseModel
 
 from fastapi_construct import controller, get, post
+from fastapi_construct.decorators import _contains_response
 
 
 def test_response_model_inference_disabled_for_response_return_type():
@@ -86,6 +89,12 @@ def test_response_model_inference_from_type_annotation():
     assert response.json() == {"id": 2, "name": "Jane Doe"}
 
     # Verify OpenAPI schema includes the response models
-    openapi_schema = app.openapi()
-    assert "UserResponse" in openapi_schema["components"]["schemas"]
-    assert "TokenResponse" in openapi_schema["components"]["schemas"]
+    schemas = app.openapi()["components"]["schemas"]
+    assert "UserResponse" in schemas
+    assert "TokenResponse" in schemas
+
+
+def test_contains_response_handles_unhashable_annotations():
+    assert _contains_response(Response) is True
+    assert _contains_response(Annotated[Response, {"unhashable": True}]) is True
+    assert _contains_response(int) is False
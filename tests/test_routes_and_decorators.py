@@ -14,10 +14,10 @@ from fastapi_construct.routes import delete, get, patch, post, put
 
 @pytest.fixture(autouse=True)
 def clear_registry() -> Generator[None, Any, None]:
-    """Clear the dependency registry before and after each test."""
-    container.default_container._registry.clear()
+    """Reset the default container (registry, compiled resolvers, singletons) before and after each test."""
+    container.default_container.reset()
     yield
-    container.default_container._registry.clear()
+    container.default_container.reset()
 
 
 class TestRouteDecorators:
@@ -309,6 +309,43 @@ class TestControllerDecorator:
         assert len(routes) == 1
         assert any("/public" in getattr(r, "path", "") for r in routes)
 
+    def test_controller_registers_inherited_routes(self) -> None:
+        """Test that routes defined on a base class are registered unless overridden."""
+
+        class BaseController:
+            @get("/ping")
+            def ping(self) -> str:
+                return "pong"
+
+            @get("/hidden")
+            def hidden(self) -> str:
+                return "base"
+
+        @controller(prefix="/child")
+        class ChildController(BaseController):
+            def hidden(self) -> str:
+                return "overridden without a route"
+
+            @get("/own")
+            def own(self) -> str:
+                return "own"
+
+        paths = {getattr(r, "path", "") for r in ChildController.router.routes}
+        assert paths == {"/child/ping", "/child/own"}
+
+    def test_controller_registers_staticmethod_routes(self) -> None:
+        """Test that routes declared on static methods are registered like regular methods."""
+
+        @controller(prefix="/s")
+        class StaticController:
+            @staticmethod
+            @get("/static")
+            def static() -> str:
+                return "static"
+
+        paths = {getattr(r, "path", "") for r in StaticController.router.routes}
+        assert paths == {"/s/static"}
+
     def test_controller_with_path_parameters(self) -> None:
         """Test controller with path parameters."""
 